@@ -1,8 +1,9 @@
 use std::{
-    collections::{BTreeSet, HashSet},
+    collections::{BTreeSet, HashSet, VecDeque},
     env, fs,
     path::Path,
     process::Command,
+    sync::OnceLock,
 };
 
 use anyhow::{bail, Context, Result};
@@ -387,7 +388,7 @@ pub fn run_ownership_annotation_ratchet(args: &[String]) -> Result<()> {
     .unwrap_or_default();
     let mut violations = Vec::new();
     let mut current_file = String::new();
-    let mut window: Vec<String> = Vec::new();
+    let mut window: VecDeque<String> = VecDeque::new();
 
     for line in diff.lines() {
         if let Some(file) = line.strip_prefix("+++ b/") {
@@ -403,9 +404,9 @@ pub fn run_ownership_annotation_ratchet(args: &[String]) -> Result<()> {
             if line.starts_with("+++") {
                 continue;
             }
-            window.push(added.to_string());
+            window.push_back(added.to_string());
             if window.len() > 16 {
-                window.remove(0);
+                window.pop_front();
             }
             if candidate_requires_attr(mode, &current_file, added)
                 && !window.iter().any(|entry| entry.contains(required_attr))
@@ -590,7 +591,7 @@ pub fn run_runtime_boundary_allowlist(args: &[String]) -> Result<()> {
         "runtime-boundary-allowlist: usage: check runtime-boundary-allowlist <instrumentation|concurrency>",
     )?;
     let repo_root = repo_root()?;
-    let (label, matches, skip_pattern, approved_sites, fail_msg) = match mode {
+    let (label, matches, skip_pattern, approved_site, fail_msg) = match mode {
         "instrumentation" => (
             "runtime instrumentation schema",
             rg_non_comment_lines(&vec![
@@ -602,14 +603,9 @@ pub fn run_runtime_boundary_allowlist(args: &[String]) -> Result<()> {
                 "*.rs".into(),
             ])?,
             Regex::new(r"^crates/aura-agent/src/runtime/instrumentation\.rs:")?,
-            vec![
-                Regex::new(r"^crates/aura-agent/src/task_registry\.rs:")?,
-                Regex::new(r"^crates/aura-agent/src/runtime/services/ceremony_tracker\.rs:")?,
-                Regex::new(r"^crates/aura-agent/src/runtime/services/rendezvous_manager\.rs:")?,
-                Regex::new(r"^crates/aura-agent/src/runtime/services/maintenance_service\.rs:")?,
-                Regex::new(r"^crates/aura-agent/src/runtime/services/sync_manager\.rs:")?,
-                Regex::new(r"^crates/aura-agent/src/runtime/system\.rs:")?,
-            ],
+            Regex::new(
+                r"^crates/aura-agent/src/(task_registry|runtime/services/(ceremony_tracker|rendezvous_manager|maintenance_service|sync_manager)|runtime/system)\.rs:",
+            )?,
             "runtime event names must come from runtime/instrumentation.rs or be explicitly allowlisted",
         ),
         "concurrency" => (
@@ -624,9 +620,9 @@ pub fn run_runtime_boundary_allowlist(args: &[String]) -> Result<()> {
             Regex::new(
                 r"^crates/aura-agent/src/runtime/(vm_hardening|vm_host_bridge|choreo_engine)\.rs:",
             )?,
-            vec![Regex::new(
+            Regex::new(
                 r"^crates/aura-agent/src/runtime/contracts\.rs:.*canonical_fallback_policy\(",
-            )?],
+            )?,
             "non-admitted concurrency path bypasses vm_hardening.rs / vm_host_bridge.rs / choreo_engine.rs",
         ),
         other => bail!("runtime-boundary-allowlist: unknown mode {other}"),
@@ -634,7 +630,7 @@ pub fn run_runtime_boundary_allowlist(args: &[String]) -> Result<()> {
     let violations: Vec<_> = matches
         .into_iter()
         .filter(|hit| !skip_pattern.is_match(hit))
-        .filter(|hit| !approved_sites.iter().any(|approved| approved.is_match(hit)))
+        .filter(|hit| !approved_site.is_match(hit))
         .collect();
     if !violations.is_empty() {
         for violation in violations {
@@ -4102,10 +4098,9 @@ fn file_has_attr_for_function(
     attr: &str,
 ) -> Result<bool> {
     let lines = read_lines(path)?;
+    let fn_needle = format!("fn {function_name}(");
     for (idx, line) in lines.iter().enumerate() {
-        if line.contains(&format!("fn {function_name}("))
-            || line.contains(&format!("async fn {function_name}("))
-        {
+        if line.contains(&fn_needle) {
             let start = idx.saturating_sub(16);
             return Ok(lines[start..idx].iter().any(|line| line.contains(attr)));
         }
@@ -4114,23 +4109,35 @@ fn file_has_attr_for_function(
 }
 
 fn candidate_requires_attr(mode: &str, current_file: &str, added: &str) -> bool {
+    static SEMANTIC_OWNER_RE: OnceLock<Regex> = OnceLock::new();
+    static ACTOR_OWNED_RE: OnceLock<Regex> = OnceLock::new();
+    static CAPABILITY_BOUNDARY_RE: OnceLock<Regex> = OnceLock::new();
+
     match mode {
         "semantic-owner" => {
             (current_file.starts_with("crates/aura-app/src/workflows/")
                 || current_file.starts_with("crates/aura-web/src/")
                 || current_file.starts_with("crates/aura-terminal/src/"))
-                && Regex::new(
-                    r"^\s*(pub(\s*\([^)]*\))?\s+)?async\s+fn\s+[A-Za-z0-9_]+(_owned|_with_terminal_status)\(",
-                )
-                .unwrap()
-                .is_match(added)
+                && added.contains("async")
+                && SEMANTIC_OWNER_RE
+                    .get_or_init(|| {
+                        Regex::new(
+                            r"^\s*(pub(\s*\([^)]*\))?\s+)?async\s+fn\s+[A-Za-z0-9_]+(_owned|_with_terminal_status)\(",
+                        )
+                        .expect("valid semantic-owner regex")
+                    })
+                    .is_match(added)
         },
         "actor-owned" => current_file.starts_with("crates/aura-agent/src/runtime/services/")
-            && Regex::new(
-                r".*struct\s+[A-Za-z0-9_]*(Service|Manager|Coordinator|Subsystem|Actor)(\s*[{<]|$)",
-            )
-            .unwrap()
-            .is_match(added),
+            && added.contains("struct")
+            && ACTOR_OWNED_RE
+                .get_or_init(|| {
+                    Regex::new(
+                        r".*struct\s+[A-Za-z0-9_]*(Service|Manager|Coordinator|Subsystem|Actor)(\s*[{<]|$)",
+                    )
+                    .expect("valid actor-owned regex")
+                })
+                .is_match(added),
         "capability-boundary" => {
             (current_file.starts_with("crates/aura-app/src/workflows/")
                 || current_file.starts_with("crates/aura-agent/src/runtime_bridge/")
@@ -4138,11 +4145,15 @@ fn candidate_requires_attr(mode: &str, current_file: &str, added: &str) -> bool
                 || current_file.starts_with("crates/aura-chat/src/")
                 || current_file.starts_with("crates/aura-invitation/src/")
                 || current_file.starts_with("crates/aura-recovery/src/"))
-                && Regex::new(
-                    r".*fn\s+(issue_[A-Za-z0-9_]+_(proof|context)|[A-Za-z0-9_]*capability|authorize_[A-Za-z0-9_]+|secure_storage_[A-Za-z0-9_]+|plan_[A-Za-z0-9_]+|validate_setup_inputs|build_setup_completion|map_invitation_type|map_channel_metadata|collect_moderation_homes|get_settings|list_devices|list_authorities|set_nickname_suggestion|set_mfa_policy|current_time_ms|sleep_ms|authentication_status|get_sync_status|is_peer_online|get_sync_peers|trigger_sync|process_ceremony_messages|sync_with_peer|ensure_peer_channel)\(",
-                )
-                .unwrap()
-                .is_match(added)
+                && added.contains("fn")
+                && CAPABILITY_BOUNDARY_RE
+                    .get_or_init(|| {
+                        Regex::new(
+                            r".*fn\s+(issue_[A-Za-z0-9_]+_(proof|context)|[A-Za-z0-9_]*capability|authorize_[A-Za-z0-9_]+|secure_storage_[A-Za-z0-9_]+|plan_[A-Za-z0-9_]+|validate_setup_inputs|build_setup_completion|map_invitation_type|map_channel_metadata|collect_moderation_homes|get_settings|list_devices|list_authorities|set_nickname_suggestion|set_mfa_policy|current_time_ms|sleep_ms|authentication_status|get_sync_status|is_peer_online|get_sync_peers|trigger_sync|process_ceremony_messages|sync_with_peer|ensure_peer_channel)\(",
+                        )
+                        .expect("valid capability-boundary regex")
+                    })
+                    .is_match(added)
         },
         _ => false,
     }
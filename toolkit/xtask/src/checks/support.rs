@@ -21,9 +21,20 @@ pub fn read_lines(path: impl AsRef<Path>) -> Result<Vec<String>> {
     Ok(read(path)?.lines().map(str::to_owned).collect())
 }
 
+/// Build output and tool-managed directories that never hold scanned sources.
+const PRUNED_DIRS: &[&str] = &["target", ".git", "node_modules", "vendor", ".direnv"];
+
 pub fn rust_files_under(path: impl AsRef<Path>) -> Vec<PathBuf> {
     WalkDir::new(path)
         .into_iter()
+        .filter_entry(|entry| {
+            entry.depth() == 0
+                || !entry.file_type().is_dir()
+                || !entry
+                    .file_name()
+                    .to_str()
+                    .is_some_and(|name| PRUNED_DIRS.contains(&name))
+        })
         .filter_map(Result::ok)
         .map(|entry| entry.into_path())
         .filter(|path| path.extension().and_then(OsStr::to_str) == Some("rs"))
@@ -41,11 +52,10 @@ pub fn dirs_under(path: impl AsRef<Path>) -> Vec<PathBuf> {
 }
 
 pub fn first_match_line(path: impl AsRef<Path>, needle: &str) -> Result<Option<usize>> {
-    let lines = read_lines(path)?;
-    Ok(lines
-        .iter()
-        .enumerate()
-        .find_map(|(idx, line)| line.contains(needle).then_some(idx + 1)))
+    Ok(read(path)?
+        .lines()
+        .position(|line| line.contains(needle))
+        .map(|idx| idx + 1))
 }
 
 pub fn contains(path: impl AsRef<Path>, needle: &str) -> Result<bool> {